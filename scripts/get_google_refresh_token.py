@@ -2,7 +2,6 @@
 import os
 import sys
 from dotenv import load_dotenv
-from google_auth_oauthlib.flow import InstalledAppFlow
 
 # Load environment variables from .env file
 load_dotenv()
@@ -23,6 +22,9 @@ def main() -> None:
         print("ERROR: Set GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET in your environment.", file=sys.stderr)
         sys.exit(1)
 
+    # Imported only once the credentials are known to be present; pulls in requests/oauthlib
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     # Build a client config structure compatible with InstalledAppFlow.from_client_config
     client_config = {
         "installed": {
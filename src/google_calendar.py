@@ -1,17 +1,145 @@
+import asyncio
+import functools
+import importlib.util
+import itertools
+import json
 import os
+import random
+import re
+import threading
 import time
-from typing import Any, Dict, List, Optional
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, NamedTuple, NoReturn, Optional, Tuple
+from urllib.parse import quote, unquote
+from zoneinfo import ZoneInfo
+
+import httplib2
+import httpx
 
 from google.oauth2.credentials import Credentials
 from google.auth.exceptions import RefreshError
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from google_auth_httplib2 import AuthorizedHttp, Request
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
+from googleapiclient.errors import BatchError, HttpError
+from googleapiclient.http import build_http
 
 
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
+# build_from_document() fills the standard query parameters into the shared document
+_BUILD_LOCK = threading.Lock()
+_LOCAL = threading.local()
+_REFRESH_LOCK = threading.Lock()
+
+# Google recommends keeping Calendar batch requests at or below 50 calls
+_BATCH_LIMIT = 50
+
+# Worker threads for list_events' aggregate path; each keeps its own service (and
+# connection) in _LOCAL, so the pool lives for the whole process. Kept small to stay
+# clear of per-user rate limits.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="gcal")
+
+# Calendars list_events_async() pulls concurrently itself; more than this go through the
+# batched list_events() path instead
+_ASYNC_FANOUT_MAX = 8
+
+# Events requested per events.list page; larger max_results follow nextPageToken
+_EVENTS_PAGE_SIZE = 500
+
+# Partial responses: only request the fields the normalizers read
+_CALENDAR_LIST_FIELDS = "etag,nextPageToken,items(id,summary,primary,accessRole,timeZone)"
+_EVENT_FIELDS = "id,summary,description,start,end,location,status"
+_EVENT_LIST_FIELDS = f"etag,nextPageToken,items({_EVENT_FIELDS})"
+_INSTANCE_ID_FIELDS = "items(id,originalStartTime)"
+_INSTANCE_LIST_FIELDS = "items(id,recurringEventId,originalStartTime,start,end,status,summary,location)"
+
+_MAX_ATTEMPTS = 5
+# Bounds for the decorrelated-jitter backoff between attempts, in seconds
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 8.0
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+# 403 reasons that mean "slow down" rather than "forbidden"
+_RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded", "RATE_LIMIT_EXCEEDED"})
+# Upper bound on a server-requested Retry-After delay, in seconds
+_MAX_RETRY_AFTER = 30.0
+
+_REMINDER_METHODS = frozenset({"email", "popup"})
+# UNTIL= and COUNT= parts of an RRULE, which update_following_instances() replaces
+_RRULE_STRIP = re.compile(r"(?i)(?:^|;)(?:UNTIL|COUNT)=[^;]*")
+_UNTIL_FMT = "%Y%m%dT%H%M%SZ"
+
+# Plain-text event fields update_event copies straight from the patch
+_PATCHABLE_FIELDS = ("summary", "description", "location")
+
+
+class _CalendarEntry(NamedTuple):
+    # Cached calendar list with its lookup indexes; see _calendar_entry()
+    expires_at: float
+    calendars: List[Dict[str, Any]]
+    # Lowercased id / summary -> calendar id, for resolve_calendar_id()
+    by_id: Dict[str, str]
+    by_summary: Dict[str, str]
+    # Calendar id -> display name, for calendar_summary()
+    summaries: Dict[str, Optional[str]]
+    # Collection etag, set only when the whole list fit in one page
+    etag: Optional[str]
+
+
+# refresh token -> cached calendar list
+_CALENDAR_CACHE: Dict[Optional[str], _CalendarEntry] = {}
+_CALENDAR_CACHE_TTL = 300.0
+
+# (refresh token, lowercased query) -> (expires_at, calendar id); see resolve_calendar_id()
+_CALENDAR_ID_CACHE: Dict[Tuple[Optional[str], str], Tuple[float, str]] = {}
+_CALENDAR_ID_CACHE_TTL = 600.0
+# Calendar-level URIs only (the calendar itself or its events list); a 404 under
+# /events/<id> is about an event and says nothing about the calendar
+_CALENDAR_URI = re.compile(r"/calendar/v3/calendars/([^/?]+)(?:/events)?(?:[?]|$)")
+
+# Base URL for the async path, which calls the Calendar REST API directly over httpx
+_API_ROOT = "https://www.googleapis.com/calendar/v3"
+# (event loop, client): an httpx connection pool belongs to the loop that opened it
+_ASYNC_CLIENT: Optional[Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = None
+# Concurrent pulls multiplex over one HTTP/2 connection when the h2 package is available
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# (refresh token, calendar id, event id) -> (fetched_at, event); see _get_event()
+_EVENT_CACHE: Dict[Tuple[Optional[str], str, str], Tuple[float, Dict[str, Any]]] = {}
+_EVENT_CACHE_TTL = 60.0
+_EVENT_CACHE_MAX = 128
+
+# (refresh token, calendar id, query params) -> (fetched_at, page); see _list_events_page()
+_EVENTS_PAGE_CACHE: Dict[Tuple[Optional[str], str, Tuple[Tuple[str, Any], ...]], Tuple[float, Dict[str, Any]]] = {}
+_EVENTS_PAGE_CACHE_TTL = 30.0
+_EVENTS_PAGE_CACHE_MAX = 256
+# (refresh token, calendar id) -> writes seen; a page fetched across a write is not cached
+_EVENTS_PAGE_GENERATION: Dict[Tuple[Optional[str], str], int] = {}
+
+# Patch body that cancels a single occurrence of a recurring event
+_CANCELLED: Dict[str, Any] = {"status": "cancelled"}
+
+# Shared read-only default for missing start/end objects
+_EMPTY: Dict[str, Any] = {}
+
 
 def build_service():
+    # httplib2 connections are not thread-safe, so each thread keeps its own Resource;
+    # the credentials (and the access token they hold) are shared by all of them.
+    key = _credentials_key()
+    cached = getattr(_LOCAL, "service", None)
+    if cached is None or cached[0] != key:
+        # One keep-alive httplib2 connection pool per thread, authorized with the shared credentials
+        http = AuthorizedHttp(_cached_credentials(*key), http=build_http())
+        with _BUILD_LOCK:
+            service = build_from_document(_discovery_document(), http=http)
+        cached = _LOCAL.service = (key, service)
+    return cached[1]
+
+
+def _credentials_key() -> Tuple[str, str, str]:
     refresh_token = os.environ.get("GOOGLE_REFRESH_TOKEN")
     client_id = os.environ.get("GOOGLE_CLIENT_ID")
     client_secret = os.environ.get("GOOGLE_CLIENT_SECRET")
@@ -21,8 +149,34 @@ def build_service():
             "Missing required environment variables: GOOGLE_REFRESH_TOKEN, "
             "GOOGLE_CLIENT_ID, and GOOGLE_CLIENT_SECRET must be set"
         )
-    
-    creds = Credentials(
+    return refresh_token, client_id, client_secret
+
+
+def warm_up() -> None:
+    # Pay the process-wide one-off costs (discovery parse, first token exchange) at startup
+    # instead of inside the first tool call; services are per-thread and built on first use
+    _discovery_document()
+    creds = _cached_credentials(*_credentials_key())
+    if not creds.valid:
+        creds.refresh(Request(build_http()))
+
+
+class _SharedCredentials(Credentials):
+    # One instance is shared by every per-thread service. AuthorizedHttp stamps the current
+    # token on each request as it is sent and refreshes on 401, so a burst of 401s or
+    # expiries across threads would otherwise trigger one token exchange per thread.
+    def refresh(self, request):
+        stale_token = self.token
+        with _REFRESH_LOCK:
+            # Another thread may have refreshed while we waited for the lock
+            if self.token != stale_token and self.valid:
+                return
+            super().refresh(request)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_credentials(refresh_token: str, client_id: str, client_secret: str) -> Credentials:
+    creds = _SharedCredentials(
         None,
         refresh_token=refresh_token,
         token_uri="https://oauth2.googleapis.com/token",
@@ -30,43 +184,189 @@ def build_service():
         client_secret=client_secret,
         scopes=SCOPES,
     )
-    
-    return build("calendar", "v3", credentials=creds, cache_discovery=False)
+    # The access token is fetched on the first request only. Once it is within a few
+    # minutes of expiry, google-auth refreshes it on a background thread while requests
+    # keep using the current token; only an already-expired token blocks a request.
+    creds.with_non_blocking_refresh()
+    return creds
+
+
+@functools.lru_cache(maxsize=1)
+def _discovery_document() -> Dict[str, Any]:
+    # google-api-python-client ships the Calendar v3 discovery document; read and parse
+    # it once per process instead of fetching it over the network on every build.
+    doc = discovery_cache.get_static_doc("calendar", "v3")
+    if doc is None:
+        raise RuntimeError("Calendar v3 discovery document is not bundled with googleapiclient")
+    return json.loads(doc)
 
 
 def _retry(fn, *args, **kwargs):
-    backoff = 1.0
-    for attempt in range(5):
+    delay = _BACKOFF_BASE
+    for attempt in range(_MAX_ATTEMPTS):
         try:
             return fn(*args, **kwargs)
         except HttpError as e:
-            status = getattr(e, "status_code", None) or getattr(e, "resp", {}).get("status")
-            if status and int(status) in (429, 500, 502, 503, 504):
-                time.sleep(backoff)
-                backoff = min(backoff * 2, 8)
+            # No sleep after the final attempt: the error goes straight to the caller
+            if attempt < _MAX_ATTEMPTS - 1 and _should_retry(e):
+                delay = _next_delay(delay, e)
+                time.sleep(delay)
                 continue
+            if e.status_code == 404:
+                _forget_calendar(e)
             raise
         except RefreshError as e:
-            # Provide helpful error message for expired refresh tokens
-            error_msg = str(e)
-            if "invalid_grant" in error_msg or "expired" in error_msg.lower() or "revoked" in error_msg.lower():
-                raise RefreshError(
-                    f"Refresh token has expired or been revoked. Please generate a new refresh token using:\n"
-                    f"python3 scripts/get_google_refresh_token.py\n\n"
-                    f"Original error: {error_msg}"
-                ) from e
-            raise
+            _raise_refresh_error(e)
         except Exception:
             # Non-HttpError, do not retry to avoid masking bugs
             raise
+    raise RuntimeError("retry loop exhausted")  # unreachable: every attempt returns or raises
 
 
-def list_calendars(service=None) -> List[Dict[str, Any]]:
+async def _retry_async(fn, *args, **kwargs):
+    # Same policy as _retry() for a coroutine function; the backoff sleeps on the event
+    # loop, so other requests progress in the meantime.
+    delay = _BACKOFF_BASE
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return await fn(*args, **kwargs)
+        except HttpError as e:
+            if attempt < _MAX_ATTEMPTS - 1 and _should_retry(e):
+                delay = _next_delay(delay, e)
+                await asyncio.sleep(delay)
+                continue
+            if e.status_code == 404:
+                _forget_calendar(e)
+            raise
+        except RefreshError as e:
+            _raise_refresh_error(e)
+    raise RuntimeError("retry loop exhausted")  # unreachable: every attempt returns or raises
+
+
+def _forget_calendar(e: HttpError) -> None:
+    # A 404 under /calendars/<id> may mean that calendar was deleted or renamed: drop
+    # cached resolutions to it so the next call resolves the name again.
+    match = _CALENDAR_URI.search(e.uri or "")
+    if not match:
+        return
+    calendar_id = unquote(match.group(1))
+    token = os.environ.get("GOOGLE_REFRESH_TOKEN")
+    for key, (_, cached_id) in list(_CALENDAR_ID_CACHE.items()):
+        if key[0] == token and cached_id == calendar_id:
+            _CALENDAR_ID_CACHE.pop(key, None)
+    entry = _cached_calendar_entry()
+    if entry and calendar_id.lower() in entry.by_id:
+        _CALENDAR_CACHE.pop(token, None)
+
+
+def _should_retry(e: HttpError) -> bool:
+    try:
+        status = e.status_code
+    except AttributeError:
+        # No response attached to the error
+        return False
+    return status in _RETRYABLE_STATUSES or _is_rate_limited(e)
+
+
+def _next_delay(previous: float, e: HttpError) -> float:
+    # Honor the server's Retry-After. Otherwise use decorrelated jitter: each delay is drawn
+    # between the base and three times the previous one, so clients drift out of lockstep.
+    return _retry_after(e) or min(_BACKOFF_CAP, random.uniform(_BACKOFF_BASE, previous * 3))
+
+
+def _raise_refresh_error(e: RefreshError) -> NoReturn:
+    # Provide helpful error message for expired refresh tokens
+    error_msg = str(e)
+    if "invalid_grant" in error_msg or "expired" in error_msg.lower() or "revoked" in error_msg.lower():
+        raise RefreshError(
+            f"Refresh token has expired or been revoked. Please generate a new refresh token using:\n"
+            f"python3 scripts/get_google_refresh_token.py\n\n"
+            f"Original error: {error_msg}"
+        ) from e
+    raise e
+
+
+def _is_rate_limited(e: HttpError) -> bool:
+    # Google reports per-user quota exhaustion as 403 rather than 429
+    if e.status_code != 403:
+        return False
+    # error_details holds only one of the body's lists ("details" wins over "errors"), so
+    # read both from the body: legacy "errors" reasons and google.rpc ErrorInfo reasons
+    try:
+        error = json.loads(e.content.decode("utf-8"))["error"]
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return False
+    if not isinstance(error, dict):
+        return False
+    entries = [*(error.get("errors") or ()), *(error.get("details") or ())]
+    return any(err.get("reason") in _RATE_LIMIT_REASONS for err in entries if isinstance(err, dict))
+
+
+def _retry_after(e: HttpError) -> Optional[float]:
+    value = e.resp.get("retry-after") if e.resp is not None else None
+    try:
+        return min(max(float(value), 0.0), _MAX_RETRY_AFTER) if value else None
+    except ValueError:
+        # HTTP-date form; fall back to our own backoff
+        return None
+
+
+def batch_execute(requests: List[Any], service=None) -> List[Any]:
+    """
+    Send API requests (built from `service`) as batch requests of up to 50 calls each.
+
+    Returns one entry per request, in order: its response body, or the HttpError it failed
+    with. Errors of the batch call itself (after retries) are raised, including BatchError
+    for an unusable multipart reply.
+    """
     service = service or build_service()
+    results: List[Any] = [None] * len(requests)
+
+    def collect(request_id: str, resp: Optional[Dict[str, Any]], exc: Optional[HttpError]) -> None:
+        results[int(request_id)] = resp if exc is None else exc
+
+    for offset in range(0, len(requests), _BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=collect)
+        for index in range(offset, min(offset + _BATCH_LIMIT, len(requests))):
+            batch.add(requests[index], request_id=str(index))
+        _retry(batch.execute)
+    return results
+
+
+def list_calendars(service=None, refresh: bool = False) -> List[Dict[str, Any]]:
+    if refresh:
+        # An explicit refresh also re-resolves names, which may now point elsewhere
+        token = os.environ.get("GOOGLE_REFRESH_TOKEN")
+        for key in [key for key in list(_CALENDAR_ID_CACHE) if key[0] == token]:
+            _CALENDAR_ID_CACHE.pop(key, None)
+    return list(_calendar_entry(service, refresh).calendars)
+
+
+def _calendar_entry(service=None, refresh: bool = False) -> _CalendarEntry:
+    # The calendar list changes rarely, so serve it from memory for a few minutes
+    entry = None if refresh else _cached_calendar_entry()
+    if entry is not None:
+        return entry
+
+    service = service or build_service()
+    token = os.environ.get("GOOGLE_REFRESH_TOKEN")
+    stale = _CALENDAR_CACHE.get(token)
     calendars: List[Dict[str, Any]] = []
     page_token: Optional[str] = None
+    etag: Optional[str] = None
     while True:
-        resp = _retry(service.calendarList().list(pageToken=page_token).execute)
+        request = service.calendarList().list(pageToken=page_token, fields=_CALENDAR_LIST_FIELDS)
+        if page_token is None and stale is not None and stale.etag:
+            # Revalidate the expired list; an unchanged one costs an empty 304
+            request.headers["If-None-Match"] = stale.etag
+        try:
+            resp = _retry(request.execute)
+        except HttpError as e:
+            if e.status_code != 304 or "If-None-Match" not in request.headers:
+                raise
+            entry = stale._replace(expires_at=time.monotonic() + _CALENDAR_CACHE_TTL)
+            _CALENDAR_CACHE[token] = entry
+            return entry
         for item in resp.get("items", []):
             calendars.append(
                 {
@@ -77,32 +377,239 @@ def list_calendars(service=None) -> List[Dict[str, Any]]:
                     "timeZone": item.get("timeZone"),
                 }
             )
+        if page_token is None and not resp.get("nextPageToken"):
+            # The collection etag only covers the whole list when it fits in one page
+            etag = resp.get("etag")
         page_token = resp.get("nextPageToken")
         if not page_token:
             break
-    return calendars
+
+    # Lowercased lookups for resolve_calendar_id(); the first calendar wins on duplicates
+    by_id: Dict[str, str] = {}
+    by_summary: Dict[str, str] = {}
+    for cal in calendars:
+        by_id.setdefault(cal["id"].lower(), cal["id"])
+        by_summary.setdefault((cal.get("summary") or "").strip().lower(), cal["id"])
+    summaries = {cal["id"]: cal.get("summary") for cal in calendars}
+    entry = _CalendarEntry(time.monotonic() + _CALENDAR_CACHE_TTL, calendars, by_id, by_summary, summaries, etag)
+    _CALENDAR_CACHE[token] = entry
+    return entry
+
+
+def calendar_summary(calendar_id: str, service=None) -> Optional[str]:
+    # Display name of a listed calendar, from the cached calendar list
+    return _calendar_entry(service).summaries.get(calendar_id)
+
+
+def _cached_calendar_entry() -> Optional[_CalendarEntry]:
+    # Peek at the calendar list cache without triggering a fetch
+    entry = _CALENDAR_CACHE.get(os.environ.get("GOOGLE_REFRESH_TOKEN"))
+    if entry and time.monotonic() < entry.expires_at:
+        return entry
+    return None
 
 
 def resolve_calendar_id(query: Optional[str], service=None) -> str:
-    service = service or build_service()
-    if not query:
+    if not query or query == "primary":
         return "primary"
-    # Accept direct ID
-    try:
-        # Quick probe: get calendar by id
-        _retry(service.calendars().get(calendarId=query).execute)
-        return query
-    except Exception:
-        pass
-
-    qnorm = (query or "").strip().lower()
-    for cal in list_calendars(service):
-        if cal["id"].lower() == qnorm:
-            return cal["id"]
-        if (cal.get("summary") or "").strip().lower() == qnorm:
-            return cal["id"]
+    qnorm = query.strip().lower()
+    token = os.environ.get("GOOGLE_REFRESH_TOKEN")
+    cached = _CALENDAR_ID_CACHE.get((token, qnorm))
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+
+    calendar_id = _resolve_calendar_id(query, qnorm, service)
+    if calendar_id != "primary":
+        # Remember the answer under both the query and the resolved id
+        entry = (time.monotonic() + _CALENDAR_ID_CACHE_TTL, calendar_id)
+        _CALENDAR_ID_CACHE[(token, qnorm)] = _CALENDAR_ID_CACHE[(token, calendar_id.lower())] = entry
+    return calendar_id
+
+
+def _resolve_calendar_id(query: str, qnorm: str, service=None) -> str:
+    service = service or build_service()
+    # Every calendar ID is email-shaped; anything else can only be a calendar name
+    if "@" in qnorm:
+        # Calendar IDs we have already listed need no probe
+        entry = _cached_calendar_entry()
+        if entry and qnorm in entry.by_id:
+            return entry.by_id[qnorm]
+        # Accept direct ID
+        try:
+            # Quick probe: get calendar by id
+            _retry(service.calendars().get(calendarId=query, fields="id").execute)
+            return query
+        except Exception:
+            pass
+
+    entry = _calendar_entry(service)
     # fallback to primary
-    return "primary"
+    return entry.by_id.get(qnorm) or entry.by_summary.get(qnorm) or "primary"
+
+
+def _events_params(
+    calendar_id: str,
+    time_min: Optional[str],
+    time_max: Optional[str],
+    max_results: Optional[int],
+    query: Optional[str],
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {
+        "calendarId": calendar_id,
+        "singleEvents": True,
+        "orderBy": "startTime",
+        "maxResults": min(_events_limit(max_results), _EVENTS_PAGE_SIZE),
+        "fields": _EVENT_LIST_FIELDS,
+    }
+    if time_min:
+        params["timeMin"] = time_min
+    if time_max:
+        params["timeMax"] = time_max
+    if query:
+        params["q"] = query
+    return params
+
+
+def _events_limit(max_results: Optional[int]) -> int:
+    return max(1, int(max_results or 50))
+
+
+def _normalize_event(ev: Dict[str, Any], calendar_id: str, _get=dict.get) -> Dict[str, Any]:
+    # The single event view returned by list/create/update; keep in sync with _EVENT_FIELDS
+    start = _get(ev, "start") or _EMPTY
+    end = _get(ev, "end") or _EMPTY
+    return {
+        "calendarId": calendar_id,
+        "eventId": _get(ev, "id"),
+        "summary": _get(ev, "summary"),
+        "description": _get(ev, "description"),
+        "start": _get(start, "dateTime") or _get(start, "date"),
+        "end": _get(end, "dateTime") or _get(end, "date"),
+        "timeZone": _get(start, "timeZone") or _get(end, "timeZone"),
+        "location": _get(ev, "location"),
+        "status": _get(ev, "status"),
+    }
+
+
+def _iter_events(
+    params: Dict[str, Any], limit: int, service=None, resp: Optional[Dict[str, Any]] = None
+) -> Iterator[Dict[str, Any]]:
+    # Yields normalized events page by page, following nextPageToken until `limit` events
+    # have been produced. `resp` is an already-fetched first page, if any.
+    service = service or build_service()
+    calendar_id = params["calendarId"]
+    while True:
+        if resp is None:
+            resp = _retry(service.events().list(**params).execute)
+        items = resp.get("items", ())
+        for ev in itertools.islice(items, limit):
+            yield _normalize_event(ev, calendar_id)
+        limit -= len(items)
+        page_token = resp.get("nextPageToken")
+        if limit <= 0 or not page_token:
+            return
+        params = {**params, "pageToken": page_token, "maxResults": min(limit, _EVENTS_PAGE_SIZE)}
+        resp = None
+
+
+def _pull_events(params: Dict[str, Any], limit: int, service=None) -> List[Dict[str, Any]]:
+    return list(_iter_events(params, limit, service))
+
+
+async def _pull_events_async(params: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+    calendar_id = params["calendarId"]
+    events: List[Dict[str, Any]] = []
+    while True:
+        resp = await _retry_async(_list_events_page, params)
+        items = resp.get("items", ())
+        events.extend(_normalize_event(ev, calendar_id) for ev in itertools.islice(items, limit))
+        limit -= len(items)
+        page_token = resp.get("nextPageToken")
+        if limit <= 0 or not page_token:
+            return events
+        params = {**params, "pageToken": page_token, "maxResults": min(limit, _EVENTS_PAGE_SIZE)}
+
+
+async def _list_events_page(params: Dict[str, Any]) -> Dict[str, Any]:
+    # Identical queries within a few seconds are answered from memory; older pages are
+    # revalidated with their etag, so an unchanged page costs an empty 304.
+    query = dict(params)
+    calendar_id = query.pop("calendarId")
+    key = (os.environ.get("GOOGLE_REFRESH_TOKEN"), calendar_id, tuple(sorted(query.items())))
+    generation = _EVENTS_PAGE_GENERATION.get(key[:2], 0)
+    cached = _EVENTS_PAGE_CACHE.pop(key, None)
+    if cached and time.monotonic() - cached[0] < _EVENTS_PAGE_CACHE_TTL:
+        entry = cached
+    else:
+        etag = cached[1].get("etag") if cached else None
+        page = await _async_get(f"/calendars/{quote(calendar_id, safe='')}/events", query, etag)
+        entry = (time.monotonic(), cached[1] if page is None else page)
+        if _EVENTS_PAGE_GENERATION.get(key[:2], 0) != generation:
+            # A write to this calendar finished while the page was in flight, so the page
+            # may predate it; hand it back without caching it
+            return entry[1]
+    _EVENTS_PAGE_CACHE[key] = entry
+    if len(_EVENTS_PAGE_CACHE) > _EVENTS_PAGE_CACHE_MAX:
+        # Entries are re-inserted on use, so the first one is the least recently used
+        _EVENTS_PAGE_CACHE.pop(next(iter(_EVENTS_PAGE_CACHE)))
+    return entry[1]
+
+
+async def _async_get(path: str, params: Dict[str, Any], etag: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    # One GET on the shared httpx pool; returns None when `etag` still matches (304).
+    # Failures are raised as HttpError so _retry_async() and the tools' error handling
+    # treat both transports alike.
+    creds = _cached_credentials(*_credentials_key())
+    client = _async_client()
+    resp = await client.get(path, params=params, headers=await _auth_headers(creds, etag))
+    if resp.status_code == 401:
+        # Token revoked or expired early: refresh once and resend, as AuthorizedHttp does
+        await asyncio.to_thread(creds.refresh, Request(build_http()))
+        resp = await client.get(path, params=params, headers=await _auth_headers(creds, etag))
+    if resp.status_code == 304:
+        return None
+    if resp.is_error:
+        info = httplib2.Response({**resp.headers, "status": str(resp.status_code)})
+        raise HttpError(info, resp.content, uri=str(resp.url))
+    return resp.json()
+
+
+async def _auth_headers(creds: Credentials, etag: Optional[str] = None) -> Dict[str, str]:
+    if not creds.valid:
+        # The token exchange goes through blocking httplib2, so keep it off the loop
+        await asyncio.to_thread(creds.refresh, Request(build_http()))
+    headers: Dict[str, str] = {"If-None-Match": etag} if etag else {}
+    creds.apply(headers)
+    return headers
+
+
+def _async_client() -> httpx.AsyncClient:
+    global _ASYNC_CLIENT
+    loop = asyncio.get_running_loop()
+    if _ASYNC_CLIENT is None or _ASYNC_CLIENT[0] is not loop:
+        _ASYNC_CLIENT = (loop, httpx.AsyncClient(base_url=_API_ROOT, http2=_HTTP2, timeout=30.0))
+    return _ASYNC_CLIENT[1]
+
+
+def list_events_iter(
+    calendar: Optional[str] = None,
+    time_min: Optional[str] = None,
+    time_max: Optional[str] = None,
+    max_results: Optional[int] = 50,
+    query: Optional[str] = None,
+    include_all_calendars: bool = False,
+    service=None,
+) -> Iterator[Dict[str, Any]]:
+    # Streaming variant of list_events(): pages are fetched only as the caller consumes them
+    service = service or build_service()
+    limit = _events_limit(max_results)
+    if include_all_calendars or not calendar:
+        calendar_ids = [cal["id"] for cal in list_calendars(service)]
+    else:
+        calendar_ids = [resolve_calendar_id(calendar, service)]
+    for calendar_id in calendar_ids:
+        params = _events_params(calendar_id, time_min, time_max, max_results, query)
+        yield from _iter_events(params, limit, service)
 
 
 def list_events(
@@ -114,50 +621,132 @@ def list_events(
     include_all_calendars: bool = False,
     service=None,
 ) -> List[Dict[str, Any]]:
+    # A caller-supplied service is bound to the caller's thread, so it is used serially
+    parallel = service is None
     service = service or build_service()
-
-    def pull(calendar_id: str) -> List[Dict[str, Any]]:
-        params: Dict[str, Any] = {
-            "calendarId": calendar_id,
-            "singleEvents": True,
-            "orderBy": "startTime",
-            "maxResults": max(1, min(int(max_results or 50), 500)),
-        }
-        if time_min:
-            params["timeMin"] = time_min
-        if time_max:
-            params["timeMax"] = time_max
-        if query:
-            params["q"] = query
-
-        resp = _retry(service.events().list(**params).execute)
-        events: List[Dict[str, Any]] = []
-        for ev in resp.get("items", []):
-            start = ev.get("start", {})
-            end = ev.get("end", {})
-            events.append(
-                {
-                    "calendarId": calendar_id,
-                    "eventId": ev.get("id"),
-                    "summary": ev.get("summary"),
-                    "description": ev.get("description"),
-                    "start": start.get("dateTime") or start.get("date"),
-                    "end": end.get("dateTime") or end.get("date"),
-                    "timeZone": start.get("timeZone") or end.get("timeZone"),
-                    "location": ev.get("location"),
-                    "status": ev.get("status"),
-                }
-            )
-        return events
+    limit = _events_limit(max_results)
 
     if include_all_calendars or not calendar:
+        calendar_ids = [cal["id"] for cal in list_calendars(service)]
+        params = [_events_params(cid, time_min, time_max, max_results, query) for cid in calendar_ids]
+        first_pages: Dict[int, Dict[str, Any]] = {}
+
+        def fetch_chunk(offset: int) -> None:
+            # One multipart round-trip per chunk of calendars instead of one per calendar
+            chunk_service = service if not parallel else build_service()
+            indices = range(offset, min(offset + _BATCH_LIMIT, len(calendar_ids)))
+            try:
+                pages = batch_execute([chunk_service.events().list(**params[i]) for i in indices], chunk_service)
+            except BatchError:
+                # Unusable multipart reply: the chunk's calendars are pulled one by one instead
+                return
+            for index, page in zip(indices, pages):
+                # Failed sub-requests are left out and pulled again individually below
+                if not isinstance(page, HttpError):
+                    first_pages[index] = page
+
+        def pull(index: int) -> List[Dict[str, Any]]:
+            pull_service = service if not parallel else build_service()
+            return list(_iter_events(params[index], limit, pull_service, first_pages.get(index)))
+
+        _run_all(fetch_chunk, range(0, len(calendar_ids), _BATCH_LIMIT), parallel)
+
+        # Calendars whose first page settled the answer need no further requests
+        results: List[List[Dict[str, Any]]] = [[] for _ in calendar_ids]
+        pending = []
+        for index in range(len(calendar_ids)):
+            page = first_pages.get(index)
+            if page is None or (page.get("nextPageToken") and len(page.get("items", [])) < limit):
+                pending.append(index)
+            else:
+                results[index] = pull(index)
+        for index, pulled in zip(pending, _run_all(pull, pending, parallel)):
+            results[index] = pulled
+
         events: List[Dict[str, Any]] = []
-        for cal in list_calendars(service):
-            events.extend(pull(cal["id"]))
+        for pulled in results:
+            events.extend(pulled)
         return events
     else:
         calendar_id = resolve_calendar_id(calendar, service)
-        return pull(calendar_id)
+        return _pull_events(_events_params(calendar_id, time_min, time_max, max_results, query), limit, service)
+
+
+def _run_all(fn, args, parallel: bool = True) -> List[Any]:
+    # Fans fn out over _EXECUTOR; a single call (or a serial caller) stays on this thread
+    args = list(args)
+    if not parallel or len(args) < 2:
+        return [fn(arg) for arg in args]
+    return list(_EXECUTOR.map(fn, args))
+
+
+async def list_events_async(
+    calendar: Optional[str] = None,
+    time_min: Optional[str] = None,
+    time_max: Optional[str] = None,
+    max_results: Optional[int] = 50,
+    query: Optional[str] = None,
+    include_all_calendars: bool = False,
+) -> List[Dict[str, Any]]:
+    # Same result as list_events(), but every calendar is pulled concurrently over one
+    # shared httpx connection pool, so the event loop is never blocked on Calendar calls.
+    # Aggregates over many calendars are handed to list_events() on a worker thread, where
+    # one batch request covers up to 50 calendars instead of one GET each.
+    limit = _events_limit(max_results)
+    if include_all_calendars or not calendar:
+        calendar_ids = [cal["id"] for cal in await asyncio.to_thread(list_calendars)]
+        if len(calendar_ids) > _ASYNC_FANOUT_MAX:
+            return await asyncio.to_thread(
+                list_events, None, time_min, time_max, max_results, query, include_all_calendars=True
+            )
+    else:
+        calendar_ids = [await asyncio.to_thread(resolve_calendar_id, calendar)]
+    pulled = await asyncio.gather(
+        *(
+            _pull_events_async(_events_params(cid, time_min, time_max, max_results, query), limit)
+            for cid in calendar_ids
+        )
+    )
+    return [ev for events in pulled for ev in events]
+
+
+def _is_datetime(value: str) -> bool:
+    # An all-day date (YYYY-MM-DD) is exactly 10 characters; anything longer carries a time
+    return len(value) > 10
+
+
+def _parse_iso(dt_str: str) -> datetime:
+    # Support 'Z' and offset formats
+    if dt_str[-1:] == "Z":
+        dt_str = dt_str[:-1] + "+00:00"
+    return datetime.fromisoformat(dt_str)
+
+
+def _datetime_obj(value: str, time_zone: Optional[str]) -> Dict[str, Any]:
+    if time_zone:
+        return {"dateTime": value, "timeZone": time_zone}
+    return {"dateTime": value}
+
+
+def _clean_overrides(overrides: List[Any]) -> List[Dict[str, Any]]:
+    # Keep well-formed {method, minutes} reminder overrides, in one pass
+    return [
+        {"method": method, "minutes": int(o["minutes"])}
+        for o in overrides
+        if isinstance(o, dict)
+        and (method := str(o.get("method", "")).lower()) in _REMINDER_METHODS
+        and isinstance(o.get("minutes"), (int, float))
+    ]
+
+
+def _clean_recurrence(rules: List[Any]) -> List[str]:
+    # Keep non-blank RRULE/EXDATE strings, stripped
+    return [stripped for rule in rules if isinstance(rule, str) and (stripped := rule.strip())]
+
+
+def _event_body(**fields: Any) -> Dict[str, Any]:
+    # Build a request body in one dict allocation, leaving out unset (empty) fields
+    return {key: value for key, value in fields.items() if value}
 
 
 def create_event(
@@ -171,20 +760,120 @@ def create_event(
     reminders: Optional[Any] = None,
     recurrence: Optional[List[str]] = None,
     all_day: bool = False,
+    send_updates: Optional[str] = None,
     service=None,
 ) -> Dict[str, Any]:
     service = service or build_service()
     calendar_id = resolve_calendar_id(calendar, service)
+    body = _new_event_body(
+        summary=summary,
+        start=start,
+        end=end,
+        time_zone=time_zone,
+        description=description,
+        location=location,
+        reminders=reminders,
+        recurrence=recurrence,
+        all_day=all_day,
+    )
+
+    ev = _insert_event(service, calendar_id, body, send_updates)
+    _forget_event(calendar_id)
+    return {
+        "ok": True,
+        "event": _normalize_event(ev, calendar_id),
+    }
+
+
+def create_events(
+    calendar: str,
+    events: List[Dict[str, Any]],
+    send_updates: Optional[str] = None,
+    service=None,
+) -> Dict[str, Any]:
+    """
+    Create many events on one calendar. Each entry takes the same fields as create_event
+    (summary, start, end, time_zone, description, location, reminders, recurrence, all_day).
+
+    The calendar is resolved once and the inserts are sent as batch requests of up to 50
+    calls. Every entry is validated before anything is sent; per-event API failures are
+    reported in its result instead of aborting the events that were already created.
+    """
+    service = service or build_service()
+    calendar_id = resolve_calendar_id(calendar, service)
+    bodies = [_new_event_body(**spec) for spec in events]
+
+    def insert(body: Dict[str, Any]):
+        return service.events().insert(
+            calendarId=calendar_id, body=body, fields=_EVENT_FIELDS, sendUpdates=send_updates
+        )
 
+    results: List[Dict[str, Any]] = []
+    try:
+        for body, ev in zip(bodies, batch_execute([insert(body) for body in bodies], service)):
+            try:
+                if isinstance(ev, HttpError) and ev.status_code == 409:
+                    # A re-sent batch finds the inserts that landed the first time
+                    ev = _existing_event(service, calendar_id, body)
+                elif isinstance(ev, HttpError) and _should_retry(ev):
+                    # Retryable failures are inserted again individually
+                    ev = _insert_event(service, calendar_id, body, send_updates)
+            except HttpError as e:
+                ev = e
+            if isinstance(ev, HttpError):
+                results.append(_insert_error(ev))
+            else:
+                results.append({"ok": True, "event": _normalize_event(ev, calendar_id)})
+    finally:
+        # Earlier chunks may have landed even when a later one raised
+        _forget_event(calendar_id)
+    return {"ok": all(r["ok"] for r in results), "events": results}
+
+
+def _insert_event(
+    service, calendar_id: str, body: Dict[str, Any], send_updates: Optional[str] = None, fields: str = _EVENT_FIELDS
+) -> Dict[str, Any]:
+    # The body carries a client-chosen id, which makes the insert safe to retry: if an
+    # attempt that looked failed went through after all, the next one gets 409 and the
+    # event it created is returned instead of a duplicate.
+    try:
+        return _retry(
+            service.events()
+            .insert(calendarId=calendar_id, body=body, fields=fields, sendUpdates=send_updates)
+            .execute
+        )
+    except HttpError as e:
+        if e.status_code != 409:
+            raise
+        return _existing_event(service, calendar_id, body, fields)
+
+
+def _existing_event(service, calendar_id: str, body: Dict[str, Any], fields: str = _EVENT_FIELDS) -> Dict[str, Any]:
+    # A 409 on an insert with a client-chosen id means an earlier attempt created it
+    return _retry(service.events().get(calendarId=calendar_id, eventId=body["id"], fields=fields).execute)
+
+
+def _insert_error(e: HttpError) -> Dict[str, Any]:
+    return {"ok": False, "error": {"type": e.__class__.__name__, "message": e.reason}}
+
+
+def _new_event_body(
+    summary: str,
+    start: str,
+    end: Optional[str] = None,
+    time_zone: Optional[str] = None,
+    description: Optional[str] = None,
+    location: Optional[str] = None,
+    reminders: Optional[Any] = None,
+    recurrence: Optional[List[str]] = None,
+    all_day: bool = False,
+) -> Dict[str, Any]:
     def _extract_date(value: str) -> str:
         # Accept YYYY-MM-DD or full ISO 8601; always return YYYY-MM-DD
-        if "T" in value:
-            return value.split("T", 1)[0]
-        return value
+        return value[:10] if _is_datetime(value) else value
 
     def time_payloads(start_value: str, end_value: Optional[str]) -> (Dict[str, Any], Dict[str, Any]):
         if all_day:
-            from datetime import datetime, timedelta
             start_date = _extract_date(start_value)
             start_dt = datetime.fromisoformat(start_date)
             if end_value:
@@ -202,25 +891,21 @@ def create_event(
         else:
             if not end_value:
                 raise ValueError("end is required unless creating an all-day event (all_day=true).")
-            start_obj: Dict[str, Any] = {"dateTime": start_value}
-            end_obj: Dict[str, Any] = {"dateTime": end_value}
-            if time_zone:
-                start_obj["timeZone"] = time_zone
-                end_obj["timeZone"] = time_zone
-            return start_obj, end_obj
+            return _datetime_obj(start_value, time_zone), _datetime_obj(end_value, time_zone)
 
     start_payload, end_payload = time_payloads(start, end)
-    body: Dict[str, Any] = {"summary": summary, "start": start_payload, "end": end_payload}
-    if description:
-        body["description"] = description
-    if location:
-        body["location"] = location
+    body = _event_body(
+        # Client-generated id (base32hex-safe) so a retried insert cannot create a duplicate
+        id=uuid.uuid4().hex,
+        summary=summary,
+        description=description,
+        location=location,
+        start=start_payload,
+        end=end_payload,
+    )
     if recurrence:
         # Expecting a list of RFC 5545 RRULE/EXDATE strings, e.g. ["RRULE:FREQ=WEEKLY;COUNT=5"]
-        cleaned_rules: List[str] = []
-        for rule in recurrence:
-            if isinstance(rule, str) and rule.strip():
-                cleaned_rules.append(rule.strip())
+        cleaned_rules = _clean_recurrence(recurrence)
         if cleaned_rules:
             body["recurrence"] = cleaned_rules
     # Reminders: accept dict with useDefault/overrides, a list of overrides, or a boolean
@@ -229,13 +914,7 @@ def create_event(
         if isinstance(reminders, bool):
             rem_payload["useDefault"] = reminders
         elif isinstance(reminders, list):
-            cleaned: List[Dict[str, Any]] = []
-            for o in reminders:
-                if isinstance(o, dict):
-                    method = str(o.get("method", "")).lower()
-                    minutes = o.get("minutes")
-                    if method in ("email", "popup") and isinstance(minutes, (int, float)):
-                        cleaned.append({"method": method, "minutes": int(minutes)})
+            cleaned = _clean_overrides(reminders)
             rem_payload["useDefault"] = False
             if cleaned:
                 rem_payload["overrides"] = cleaned
@@ -245,13 +924,7 @@ def create_event(
                 rem_payload["useDefault"] = bool(reminders.get("useDefault"))
             overrides = reminders.get("overrides")
             if isinstance(overrides, list):
-                cleaned: List[Dict[str, Any]] = []
-                for o in overrides:
-                    if isinstance(o, dict):
-                        method = str(o.get("method", "")).lower()
-                        minutes = o.get("minutes")
-                        if method in ("email", "popup") and isinstance(minutes, (int, float)):
-                            cleaned.append({"method": method, "minutes": int(minutes)})
+                cleaned = _clean_overrides(overrides)
                 if cleaned:
                     rem_payload["overrides"] = cleaned
                     # If overrides provided but useDefault not explicitly set, force useDefault False
@@ -259,83 +932,64 @@ def create_event(
                         rem_payload["useDefault"] = False
         if rem_payload:
             body["reminders"] = rem_payload
-
-    ev = _retry(service.events().insert(calendarId=calendar_id, body=body).execute)
-    return {
-        "ok": True,
-        "event": {
-            "calendarId": calendar_id,
-            "eventId": ev.get("id"),
-            "summary": ev.get("summary"),
-            "description": ev.get("description"),
-            "start": ev.get("start", {}).get("dateTime") or ev.get("start", {}).get("date"),
-            "end": ev.get("end", {}).get("dateTime") or ev.get("end", {}).get("date"),
-            "timeZone": ev.get("start", {}).get("timeZone") or ev.get("end", {}).get("timeZone"),
-            "location": ev.get("location"),
-            "status": ev.get("status"),
-        },
-    }
+    return body
 
 
 def update_event(
     calendar: str,
     event_id: str,
     patch: Dict[str, Any],
+    send_updates: Optional[str] = None,
     service=None,
 ) -> Dict[str, Any]:
     service = service or build_service()
     calendar_id = resolve_calendar_id(calendar, service)
 
     # Map friendly fields to Google structure
-    body: Dict[str, Any] = {}
-    if "summary" in patch:
-        body["summary"] = patch["summary"]
-    if "description" in patch:
-        body["description"] = patch["description"]
-    if "location" in patch:
-        body["location"] = patch["location"]
-    if "recurrence" in patch and isinstance(patch.get("recurrence"), list):
-        cleaned_rules: List[str] = []
-        for rule in patch.get("recurrence") or []:
-            if isinstance(rule, str) and rule.strip():
-                cleaned_rules.append(rule.strip())
+    body: Dict[str, Any] = {key: patch[key] for key in _PATCHABLE_FIELDS if key in patch}
+    if isinstance(patch.get("recurrence"), list):
+        cleaned_rules = _clean_recurrence(patch["recurrence"])
         if cleaned_rules:
             body["recurrence"] = cleaned_rules
     tz = patch.get("time_zone") or patch.get("timeZone")
     if "start" in patch:
         start_val = patch["start"]
-        body["start"] = {"dateTime": start_val, **({"timeZone": tz} if tz else {})} if "T" in start_val else {"date": start_val}
+        body["start"] = _datetime_obj(start_val, tz) if _is_datetime(start_val) else {"date": start_val}
     if "end" in patch:
         end_val = patch["end"]
-        body["end"] = {"dateTime": end_val, **({"timeZone": tz} if tz else {})} if "T" in end_val else {"date": end_val}
+        body["end"] = _datetime_obj(end_val, tz) if _is_datetime(end_val) else {"date": end_val}
 
-    ev = _retry(service.events().patch(calendarId=calendar_id, eventId=event_id, body=body).execute)
+    ev = _retry(
+        service.events()
+        .patch(calendarId=calendar_id, eventId=event_id, body=body, fields=_EVENT_FIELDS, sendUpdates=send_updates)
+        .execute
+    )
+    _forget_event(calendar_id, event_id)
     return {
         "ok": True,
-        "event": {
-            "calendarId": calendar_id,
-            "eventId": ev.get("id"),
-            "summary": ev.get("summary"),
-            "description": ev.get("description"),
-            "start": ev.get("start", {}).get("dateTime") or ev.get("start", {}).get("date"),
-            "end": ev.get("end", {}).get("dateTime") or ev.get("end", {}).get("date"),
-            "timeZone": ev.get("start", {}).get("timeZone") or ev.get("end", {}).get("timeZone"),
-            "location": ev.get("location"),
-            "status": ev.get("status"),
-        },
+        "event": _normalize_event(ev, calendar_id),
     }
 
 
-def delete_event(calendar: str, event_id: str, as_instance: bool = False, service=None) -> Dict[str, Any]:
+def delete_event(
+    calendar: str,
+    event_id: str,
+    as_instance: bool = False,
+    send_updates: Optional[str] = None,
+    service=None,
+) -> Dict[str, Any]:
     service = service or build_service()
     calendar_id = resolve_calendar_id(calendar, service)
     if as_instance:
         # Cancel a single occurrence by marking the instance as cancelled
-        inst = _retry(service.events().get(calendarId=calendar_id, eventId=event_id).execute)
-        inst["status"] = "cancelled"
-        _retry(service.events().update(calendarId=calendar_id, eventId=event_id, body=inst).execute)
+        _retry(
+            service.events()
+            .patch(calendarId=calendar_id, eventId=event_id, body=_CANCELLED, fields="id", sendUpdates=send_updates)
+            .execute
+        )
     else:
-        _retry(service.events().delete(calendarId=calendar_id, eventId=event_id).execute)
+        _retry(service.events().delete(calendarId=calendar_id, eventId=event_id, sendUpdates=send_updates).execute)
+    _forget_event(calendar_id, event_id)
     return {"ok": True}
 
 def list_recurring_instances(
@@ -352,31 +1006,32 @@ def list_recurring_instances(
         "calendarId": calendar_id,
         "eventId": recurring_event_id,
         "maxResults": max(1, min(int(max_results or 50), 500)),
+        "fields": _INSTANCE_LIST_FIELDS,
     }
     if time_min:
         params["timeMin"] = time_min
     if time_max:
         params["timeMax"] = time_max
     resp = _retry(service.events().instances(**params).execute)
-    instances: List[Dict[str, Any]] = []
-    for inst in resp.get("items", []):
-        start = inst.get("start", {})
-        end = inst.get("end", {})
-        ost = inst.get("originalStartTime", {}) or {}
-        instances.append(
-            {
-                "calendarId": calendar_id,
-                "instanceId": inst.get("id"),
-                "recurringEventId": inst.get("recurringEventId"),
-                "originalStartTime": ost.get("dateTime") or ost.get("date"),
-                "start": start.get("dateTime") or start.get("date"),
-                "end": end.get("dateTime") or end.get("date"),
-                "status": inst.get("status"),
-                "summary": inst.get("summary"),
-                "location": inst.get("location"),
-            }
-        )
-    return {"ok": True, "instances": instances}
+    return {"ok": True, "instances": [_normalize_instance(inst, calendar_id) for inst in resp.get("items", ())]}
+
+
+def _normalize_instance(inst: Dict[str, Any], calendar_id: str, _get=dict.get) -> Dict[str, Any]:
+    # Keep in sync with _INSTANCE_LIST_FIELDS
+    start = _get(inst, "start") or _EMPTY
+    end = _get(inst, "end") or _EMPTY
+    ost = _get(inst, "originalStartTime") or _EMPTY
+    return {
+        "calendarId": calendar_id,
+        "instanceId": _get(inst, "id"),
+        "recurringEventId": _get(inst, "recurringEventId"),
+        "originalStartTime": _get(ost, "dateTime") or _get(ost, "date"),
+        "start": _get(start, "dateTime") or _get(start, "date"),
+        "end": _get(end, "dateTime") or _get(end, "date"),
+        "status": _get(inst, "status"),
+        "summary": _get(inst, "summary"),
+        "location": _get(inst, "location"),
+    }
 
 
 def cancel_recurring_instance(
@@ -391,31 +1046,27 @@ def cancel_recurring_instance(
     instance: Optional[Dict[str, Any]] = None
 
     if instance_id:
-        instance = _retry(service.events().get(calendarId=calendar_id, eventId=instance_id).execute)
         # If provided, validate it belongs to the recurring series
-        if recurring_event_id and instance.get("recurringEventId") != recurring_event_id:
-            raise ValueError("Provided instance_id does not belong to the specified recurring_event_id.")
+        if recurring_event_id:
+            instance = _retry(
+                service.events().get(calendarId=calendar_id, eventId=instance_id, fields="recurringEventId").execute
+            )
+            if instance.get("recurringEventId") != recurring_event_id:
+                raise ValueError("Provided instance_id does not belong to the specified recurring_event_id.")
     else:
         if not (recurring_event_id and original_start_time):
             raise ValueError("Provide either instance_id, or both recurring_event_id and original_start_time.")
-        # Lookup via instances and match by originalStartTime value
-        resp = _retry(
-            service.events()
-            .instances(calendarId=calendar_id, eventId=recurring_event_id, maxResults=250)
-            .execute
-        )
-        data = resp
-        for inst in data.get("items", []):
-            ost = inst.get("originalStartTime", {}) or {}
-            ost_val = ost.get("dateTime") or ost.get("date")
-            if ost_val == original_start_time:
-                instance = inst
-                break
+        instance = _instance_at(service, calendar_id, recurring_event_id, original_start_time)
         if not instance:
             raise ValueError("Could not find instance matching original_start_time.")
+        instance_id = instance["id"]
 
-    instance["status"] = "cancelled"
-    updated = _retry(service.events().update(calendarId=calendar_id, eventId=instance["id"], body=instance).execute)
+    updated = _retry(
+        service.events()
+        .patch(calendarId=calendar_id, eventId=instance_id, body=_CANCELLED, fields="id,recurringEventId,status,updated")
+        .execute
+    )
+    _forget_event(calendar_id, instance_id)
     return {
         "ok": True,
         "instance": {
@@ -427,6 +1078,80 @@ def cancel_recurring_instance(
     }
 
 
+def _instance_at(
+    service, calendar_id: str, recurring_event_id: str, original_start_time: str
+) -> Optional[Dict[str, Any]]:
+    # Let the server pick the instance by its original start
+    try:
+        resp = _retry(
+            service.events()
+            .instances(
+                calendarId=calendar_id,
+                eventId=recurring_event_id,
+                originalStart=original_start_time,
+                maxResults=1,
+                fields=_INSTANCE_ID_FIELDS,
+            )
+            .execute
+        )
+        if resp.get("items"):
+            return resp["items"][0]
+    except HttpError as e:
+        # Rejected filter value (e.g. a bare date); fall through to the scan
+        if e.status_code != 400:
+            raise
+    # Lookup via instances and match by originalStartTime value
+    resp = _retry(
+        service.events()
+        .instances(calendarId=calendar_id, eventId=recurring_event_id, maxResults=250, fields=_INSTANCE_ID_FIELDS)
+        .execute
+    )
+    for inst in resp.get("items", []):
+        ost = inst.get("originalStartTime", {}) or {}
+        if (ost.get("dateTime") or ost.get("date")) == original_start_time:
+            return inst
+    return None
+
+
+def _get_event(service, calendar_id: str, event_id: str) -> Dict[str, Any]:
+    # Full event resource (treat as read-only). A copy fetched in the last minute is
+    # revalidated with its etag, so an unchanged event comes back as an empty 304.
+    key = (os.environ.get("GOOGLE_REFRESH_TOKEN"), calendar_id, event_id)
+    cached = _EVENT_CACHE.pop(key, None)
+    request = service.events().get(calendarId=calendar_id, eventId=event_id)
+    if cached and time.monotonic() - cached[0] < _EVENT_CACHE_TTL and cached[1].get("etag"):
+        request.headers["If-None-Match"] = cached[1]["etag"]
+    try:
+        event = _retry(request.execute)
+    except HttpError as e:
+        if e.status_code != 304 or "If-None-Match" not in request.headers:
+            raise
+        event = cached[1]
+    _remember_event(calendar_id, event_id, event)
+    return event
+
+
+def _remember_event(calendar_id: str, event_id: str, event: Dict[str, Any]) -> None:
+    # Cache a full event resource (with its etag) for _get_event() to revalidate
+    _EVENT_CACHE[(os.environ.get("GOOGLE_REFRESH_TOKEN"), calendar_id, event_id)] = (time.monotonic(), event)
+    if len(_EVENT_CACHE) > _EVENT_CACHE_MAX:
+        # Entries are re-inserted on use, so the first one is the least recently used
+        _EVENT_CACHE.pop(next(iter(_EVENT_CACHE)))
+
+
+def _forget_event(calendar_id: str, event_id: Optional[str] = None) -> None:
+    # Called after every write to an event so _get_event() and _list_events_page() never
+    # serve a stale copy; without event_id only the calendar's list pages are dropped.
+    # Bumping the generation also keeps pages that were in flight during the write out
+    # of the cache.
+    token = os.environ.get("GOOGLE_REFRESH_TOKEN")
+    _EVENTS_PAGE_GENERATION[(token, calendar_id)] = _EVENTS_PAGE_GENERATION.get((token, calendar_id), 0) + 1
+    if event_id is not None:
+        _EVENT_CACHE.pop((token, calendar_id, event_id), None)
+    for key in [key for key in list(_EVENTS_PAGE_CACHE) if key[0] == token and key[1] == calendar_id]:
+        _EVENTS_PAGE_CACHE.pop(key, None)
+
+
 def update_following_instances(
     calendar: str,
     recurring_event_id: str,
@@ -444,33 +1169,28 @@ def update_following_instances(
     - Only supports dateTime (not all-day date) instances for simplicity.
     - Caller must supply new_recurrence rules for the new series.
     """
-    from datetime import datetime, timedelta, timezone
-
     service = service or build_service()
     calendar_id = resolve_calendar_id(calendar, service)
 
     # Fetch original recurring event
-    original = _retry(service.events().get(calendarId=calendar_id, eventId=recurring_event_id).execute)
+    original = _get_event(service, calendar_id, recurring_event_id)
     start_obj = original.get("start", {})
     end_obj = original.get("end", {})
     if not (start_obj.get("dateTime") and end_obj.get("dateTime")):
         raise ValueError("update_following_instances only supports events with dateTime (not all-day).")
 
     # Compute duration
-    def _parse_iso(dt_str: str) -> datetime:
-        # Support 'Z' and offset formats
-        if dt_str.endswith("Z"):
-            dt_str = dt_str.replace("Z", "+00:00")
-        return datetime.fromisoformat(dt_str)
-
     original_start_dt = _parse_iso(start_obj["dateTime"])
     original_end_dt = _parse_iso(end_obj["dateTime"])
     duration = original_end_dt - original_start_dt
 
     # Compute UNTIL just before the target start in UTC
     tgt_dt = _parse_iso(target_instance_start)
+    if tgt_dt.tzinfo is None and start_obj.get("timeZone"):
+        # A naive target is wall-clock time in the series' own zone, not the server's
+        tgt_dt = tgt_dt.replace(tzinfo=ZoneInfo(start_obj["timeZone"]))
     tgt_utc = tgt_dt.astimezone(timezone.utc) - timedelta(seconds=1)
-    until_str = tgt_utc.strftime("%Y%m%dT%H%M%SZ")
+    until_str = tgt_utc.strftime(_UNTIL_FMT)
 
     # Prepare trimmed recurrence for the original event: adjust the first RRULE line
     rec: List[str] = original.get("recurrence") or []
@@ -480,11 +1200,8 @@ def update_following_instances(
     rrule_applied = False
     for line in rec:
         if isinstance(line, str) and line.upper().startswith("RRULE:"):
-            rule = line[len("RRULE:") :].strip()
-            parts = [p for p in rule.split(";") if p]
-            parts = [p for p in parts if not p.upper().startswith("UNTIL=") and not p.upper().startswith("COUNT=")]
-            parts.append(f"UNTIL={until_str}")
-            new_rec.append("RRULE:" + ";".join(parts))
+            rule = _RRULE_STRIP.sub("", line[len("RRULE:") :].strip()).strip(";")
+            new_rec.append(f"RRULE:{rule};UNTIL={until_str}")
             rrule_applied = True
         else:
             new_rec.append(line)
@@ -493,11 +1210,14 @@ def update_following_instances(
 
     # Apply trim to original series
     trimmed_body = {"recurrence": new_rec}
-    _retry(
+    trimmed = _retry(
         service.events()
         .update(calendarId=calendar_id, eventId=recurring_event_id, body={**original, **trimmed_body})
         .execute
     )
+    _forget_event(calendar_id, recurring_event_id)
+    # The update returns the full trimmed series, so the next split of it can revalidate
+    _remember_event(calendar_id, recurring_event_id, trimmed)
 
     # Create the new series starting at target_instance_start
     new_start_dt = tgt_dt
@@ -510,6 +1230,7 @@ def update_following_instances(
         end_payload["timeZone"] = end_obj.get("timeZone")
 
     new_body: Dict[str, Any] = {
+        "id": uuid.uuid4().hex,
         "summary": change_patch.get("summary", original.get("summary")),
         "description": change_patch.get("description", original.get("description")),
         "location": change_patch.get("location", original.get("location")),
@@ -518,7 +1239,8 @@ def update_following_instances(
         "recurrence": new_recurrence,
     }
 
-    created = _retry(service.events().insert(calendarId=calendar_id, body=new_body).execute)
+    created = _insert_event(service, calendar_id, new_body, fields="id,summary,start,end,recurrence")
+    _forget_event(calendar_id)
     return {
         "ok": True,
         "newRecurringEvent": {
@@ -1,52 +1,68 @@
 #!/usr/bin/env python3
+import asyncio
+import functools
 import os
-from typing import Any, Dict, List, Optional
+import sys
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import uvicorn
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 from googleapiclient.errors import HttpError
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from typing_extensions import TypedDict
 
 # Load environment variables from .env file
 load_dotenv()
 
-try:
-    from google_calendar import (
-        list_calendars as gc_list_calendars,
-        list_events as gc_list_events,
-        create_event as gc_create_event,
-        update_event as gc_update_event,
-        delete_event as gc_delete_event,
-        resolve_calendar_id as gc_resolve_calendar_id,
-        list_recurring_instances as gc_list_instances,
-        cancel_recurring_instance as gc_cancel_instance,
-        update_following_instances as gc_update_following,
-    )
-except ModuleNotFoundError:
-    # Fallback when the working directory is the repo root and imports require the package prefix
-    from src.google_calendar import (
-        list_calendars as gc_list_calendars,
-        list_events as gc_list_events,
-        create_event as gc_create_event,
-        update_event as gc_update_event,
-        delete_event as gc_delete_event,
-        resolve_calendar_id as gc_resolve_calendar_id,
-        list_recurring_instances as gc_list_instances,
-        cancel_recurring_instance as gc_cancel_instance,
-        update_following_instances as gc_update_following,
-    )
+# Make the sibling module importable whether this file is run directly, from the repo root,
+# or loaded by path (fastmcp's `src/server.py:mcp`)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from google_calendar import (
+    list_calendars as gc_list_calendars,
+    calendar_summary as gc_calendar_summary,
+    list_events_async as gc_list_events_async,
+    create_event as gc_create_event,
+    create_events as gc_create_events,
+    update_event as gc_update_event,
+    delete_event as gc_delete_event,
+    resolve_calendar_id as gc_resolve_calendar_id,
+    list_recurring_instances as gc_list_instances,
+    cancel_recurring_instance as gc_cancel_instance,
+    update_following_instances as gc_update_following,
+    warm_up as gc_warm_up,
+)
 
 
 mcp = FastMCP("Poke Google Calendar MCP")
 
 
+class EventPatch(TypedDict, total=False):
+    # Fields gc_update_event understands; a concrete schema lets pydantic skip generic Any validation
+    summary: Optional[str]
+    description: Optional[str]
+    location: Optional[str]
+    start: str
+    end: str
+    time_zone: Optional[str]
+    timeZone: Optional[str]
+    recurrence: List[str]
+
+
+# Reminder method used for the minute lists the tools accept
+_POPUP = "popup"
+
+
 def _error_response(exc: Exception) -> Dict[str, Any]:
-    message = str(exc)
+    message = None
     if isinstance(exc, HttpError):
-        try:
-            message = exc.error_details[0]["message"] if getattr(exc, "error_details", None) else str(exc)
-        except Exception:
-            message = str(exc)
-    return {"ok": False, "error": {"type": exc.__class__.__name__, "message": message}}
+        # error_details is the parsed "errors"/"details" list, or raw text for non-JSON bodies
+        details = getattr(exc, "error_details", None)
+        if isinstance(details, list) and details and isinstance(details[0], dict):
+            message = details[0].get("message")
+    return {"ok": False, "error": {"type": exc.__class__.__name__, "message": message or str(exc)}}
 
 
 def _normalize_reminder_minutes(value: Any) -> Optional[List[int]]:
@@ -55,19 +71,41 @@ def _normalize_reminder_minutes(value: Any) -> Optional[List[int]]:
         return None
     if not isinstance(value, list):
         return None
-    minutes: List[int] = []
+    minutes: Set[int] = set()
     for item in value:
         if isinstance(item, (int, float)):
             m = int(item)
             if m >= 0:
-                minutes.append(m)
-    return sorted({m for m in minutes})
+                minutes.add(m)
+    return sorted(minutes)
+
+
+def _reminders_payload(reminders: Any) -> Optional[Dict[str, Any]]:
+    minutes_list = _normalize_reminder_minutes(reminders)
+    if minutes_list is None:
+        return None
+    # If list is empty, disable reminders; otherwise set popup overrides. The payload is a
+    # fresh dict per call since google_calendar may add to it.
+    if not minutes_list:
+        return {"useDefault": False}
+    return {"useDefault": False, "overrides": list(_popup_overrides(tuple(minutes_list)))}
+
+
+@functools.lru_cache(maxsize=128)
+def _popup_overrides(minutes: Tuple[int, ...]) -> Tuple[Dict[str, Any], ...]:
+    # The cached dicts are shared across calls; google_calendar copies overrides, never mutates them
+    return tuple({"method": _POPUP, "minutes": m} for m in minutes)
 
 
-@mcp.tool(description="List all calendars accessible to the user")
-def list_calendars() -> Dict[str, Any]:
+@mcp.tool(
+    description=(
+        "List all calendars accessible to the user. The list is cached for a few minutes; "
+        "set refresh=true to fetch it again (e.g. after adding or renaming a calendar)."
+    )
+)
+async def list_calendars(refresh: bool = False) -> Dict[str, Any]:
     try:
-        calendars = gc_list_calendars()
+        calendars = await asyncio.to_thread(gc_list_calendars, refresh=refresh)
         return {"calendars": calendars}
     except Exception as e:
         return _error_response(e)
@@ -79,7 +117,7 @@ def list_calendars() -> Dict[str, Any]:
         "Set include_all_calendars=true to aggregate."
     )
 )
-def list_events(
+async def list_events(
     calendar: Optional[str] = None,
     time_min: Optional[str] = None,
     time_max: Optional[str] = None,
@@ -88,7 +126,7 @@ def list_events(
     include_all_calendars: bool = False,
 ) -> Dict[str, Any]:
     try:
-        events = gc_list_events(
+        events = await gc_list_events_async(
             calendar=calendar,
             time_min=time_min,
             time_max=time_max,
@@ -109,10 +147,11 @@ def list_events(
         "For recurring events, pass 'recurrence' as a list of RRULE/EXDATE strings. "
         "To create an all-day event, set all_day=true and provide 'start' as YYYY-MM-DD. "
         "You may omit 'end' and it will default to the next day (exclusive). "
-        "For multi-day all-day, set 'end' to the day after the last day."
+        "For multi-day all-day, set 'end' to the day after the last day. "
+        "Set send_updates to 'all', 'externalOnly' or 'none' to control guest notifications."
     )
 )
-def create_event(
+async def create_event(
     calendar: str,
     summary: str,
     start: str,
@@ -123,18 +162,15 @@ def create_event(
     reminders: Optional[List[int]] = None,
     recurrence: Optional[List[str]] = None,
     all_day: Optional[bool] = None,
+    send_updates: Optional[str] = None,
 ) -> Dict[str, Any]:
+    if not start:
+        # Rejected here rather than by a 400 from Google a round-trip later
+        return _error_response(ValueError("start is required."))
     try:
-        minutes_list = _normalize_reminder_minutes(reminders)
-        reminders_payload: Optional[Dict[str, Any]] = None
-        if minutes_list is not None:
-            # If list is empty, disable reminders; otherwise set popup overrides
-            reminders_payload = {"useDefault": False}
-            if len(minutes_list) > 0:
-                reminders_payload["overrides"] = [
-                    {"method": "popup", "minutes": m} for m in minutes_list
-                ]
-        return gc_create_event(
+        reminders_payload = _reminders_payload(reminders)
+        return await asyncio.to_thread(
+            gc_create_event,
             calendar=calendar,
             summary=summary,
             start=start,
@@ -145,37 +181,89 @@ def create_event(
             reminders=reminders_payload,
             recurrence=recurrence,
             all_day=bool(all_day) if all_day is not None else False,
+            send_updates=send_updates,
         )
     except Exception as e:
         return _error_response(e)
 
 
-@mcp.tool(description="Update an event by ID with a JSON patch of fields to change.")
-def update_event(calendar: str, event_id: str, patch: Dict[str, Any]) -> Dict[str, Any]:
+@mcp.tool(
+    description=(
+        "Create several events on one calendar in a single batched request. Each item in 'events' "
+        "takes the same fields as create_event: summary, start, end, time_zone, description, location, "
+        "reminders (array of minutes), recurrence and all_day. Returns one result per item, in order."
+    )
+)
+async def create_events(
+    calendar: str,
+    events: List[Dict[str, Any]],
+    send_updates: Optional[str] = None,
+) -> Dict[str, Any]:
+    try:
+        specs: List[Dict[str, Any]] = []
+        for item in events:
+            spec = dict(item)
+            if "reminders" in spec:
+                spec["reminders"] = _reminders_payload(spec["reminders"])
+            if spec.get("all_day") is not None:
+                spec["all_day"] = bool(spec["all_day"])
+            specs.append(spec)
+        return await asyncio.to_thread(gc_create_events, calendar=calendar, events=specs, send_updates=send_updates)
+    except Exception as e:
+        return _error_response(e)
+
+
+@mcp.tool(
+    description=(
+        "Update an event by ID with a JSON patch of fields to change. "
+        "Set send_updates to 'all', 'externalOnly' or 'none' to control guest notifications."
+    )
+)
+async def update_event(
+    calendar: str,
+    event_id: str,
+    patch: EventPatch,
+    send_updates: Optional[str] = None,
+) -> Dict[str, Any]:
+    if not patch:
+        # Unknown keys are dropped by EventPatch validation, so this also catches a patch
+        # that names nothing update_event can change
+        return _error_response(ValueError("patch has no updatable fields"))
     try:
-        safe_patch = dict(patch or {})
-        return gc_update_event(calendar=calendar, event_id=event_id, patch=safe_patch)
+        # gc_update_event only reads the patch, so it is passed through without a copy
+        return await asyncio.to_thread(
+            gc_update_event, calendar=calendar, event_id=event_id, patch=patch, send_updates=send_updates
+        )
     except Exception as e:
         return _error_response(e)
 
 
-@mcp.tool(description="Delete an event by ID. For a single occurrence of a recurring series, set as_instance=true.")
-def delete_event(calendar: str, event_id: str, as_instance: bool = False) -> Dict[str, Any]:
+@mcp.tool(
+    description=(
+        "Delete an event by ID. For a single occurrence of a recurring series, set as_instance=true. "
+        "Set send_updates to 'all', 'externalOnly' or 'none' to control guest notifications."
+    )
+)
+async def delete_event(
+    calendar: str,
+    event_id: str,
+    as_instance: bool = False,
+    send_updates: Optional[str] = None,
+) -> Dict[str, Any]:
     try:
-        return gc_delete_event(calendar=calendar, event_id=event_id, as_instance=as_instance)
+        return await asyncio.to_thread(
+            gc_delete_event, calendar=calendar, event_id=event_id, as_instance=as_instance, send_updates=send_updates
+        )
     except Exception as e:
         return _error_response(e)
 
 
 @mcp.tool(description="Resolve a calendar by name or ID; returns the calendarId and summary")
-def resolve_calendar(query: str) -> Dict[str, Any]:
+async def resolve_calendar(query: str) -> Dict[str, Any]:
     try:
-        calendar_id = gc_resolve_calendar_id(query)
-        # fetch summary
-        for cal in gc_list_calendars():
-            if cal["id"] == calendar_id:
-                return {"calendarId": calendar_id, "summary": cal.get("summary")}
-        return {"calendarId": calendar_id, "summary": None}
+        calendar_id = await asyncio.to_thread(gc_resolve_calendar_id, query)
+        summary = await asyncio.to_thread(gc_calendar_summary, calendar_id)
+        return {"calendarId": calendar_id, "summary": summary}
     except Exception as e:
         return _error_response(e)
 
@@ -186,7 +274,7 @@ def resolve_calendar(query: str) -> Dict[str, Any]:
         "Optionally filter by time_min/time_max. Times are ISO 8601."
     )
 )
-def list_recurring_instances(
+async def list_recurring_instances(
     calendar: str,
     recurring_event_id: str,
     time_min: Optional[str] = None,
@@ -194,7 +282,8 @@ def list_recurring_instances(
     max_results: Optional[int] = 50,
 ) -> Dict[str, Any]:
     try:
-        return gc_list_instances(
+        return await asyncio.to_thread(
+            gc_list_instances,
             calendar=calendar,
             recurring_event_id=recurring_event_id,
             time_min=time_min,
@@ -212,14 +301,15 @@ def list_recurring_instances(
         "originalStartTime value (ISO 8601)."
     )
 )
-def cancel_recurring_instance(
+async def cancel_recurring_instance(
     calendar: str,
     instance_id: Optional[str] = None,
     recurring_event_id: Optional[str] = None,
     original_start_time: Optional[str] = None,
 ) -> Dict[str, Any]:
     try:
-        return gc_cancel_instance(
+        return await asyncio.to_thread(
+            gc_cancel_instance,
             calendar=calendar,
             instance_id=instance_id,
             recurring_event_id=recurring_event_id,
@@ -237,7 +327,7 @@ def cancel_recurring_instance(
         "Only supports dateTime (not all-day) events."
     )
 )
-def update_following_instances(
+async def update_following_instances(
     calendar: str,
     recurring_event_id: str,
     target_instance_start: str,
@@ -245,7 +335,8 @@ def update_following_instances(
     new_recurrence: List[str],
 ) -> Dict[str, Any]:
     try:
-        return gc_update_following(
+        return await asyncio.to_thread(
+            gc_update_following,
             calendar=calendar,
             recurring_event_id=recurring_event_id,
             target_instance_start=target_instance_start,
@@ -256,10 +347,45 @@ def update_following_instances(
         return _error_response(e)
 
 
+# Browser clients: any origin, no credentials, and only what the MCP HTTP transport uses
+_CORS = Middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization", "Mcp-Session-Id", "Mcp-Protocol-Version"],
+    expose_headers=["Mcp-Session-Id"],
+)
+
+_HEALTH_HEADERS = [
+    (b"content-type", b"text/plain"),
+    (b"content-length", b"2"),
+    (b"cache-control", b"no-store"),
+]
+
+
+def _with_healthcheck(app):
+    # Answers health probes on "/" before Starlette's middleware and routing are involved
+    async def asgi(scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/" and scope["method"] in ("GET", "HEAD"):
+            await send({"type": "http.response.start", "status": 200, "headers": _HEALTH_HEADERS})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+        await app(scope, receive, send)
+
+    return asgi
+
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
     host = "0.0.0.0"
 
+    try:
+        gc_warm_up()
+    except Exception as e:
+        # Tool calls report the same error; don't keep the server from starting
+        print(f"Google Calendar warm-up failed: {e}")
+
     print(f"Starting FastMCP server on {host}:{port}")
 
-    mcp.run(transport="http", host=host, port=port, stateless_http=True)
+    # uvicorn's default loop="auto" runs on uvloop when it is installed
+    uvicorn.run(_with_healthcheck(mcp.http_app(middleware=[_CORS], stateless_http=True)), host=host, port=port)